@@ -6,18 +6,202 @@ is automatically assigned a label). The application can also optionally crop and
 
 import sys
 import os
-import cv2
 import json
 import numpy as np
-from PIL import Image, ExifTags
-from glob import glob
-from PyQt5.QtCore import Qt, QCoreApplication
+# OpenCV and Pillow are only needed once images are loaded or saved, so they are
+# imported inside the functions that use them to keep them off the startup path
+from PyQt5.QtCore import Qt, QCoreApplication, QRunnable, QThreadPool
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QPushButton
 from PyQt5.QtWidgets import QHBoxLayout, QVBoxLayout, QFileDialog, QLabel
 from PyQt5.QtWidgets import QDesktopWidget, QMessageBox, QCheckBox
 from PyQt5.QtGui import QPixmap, QPainter, QBrush, QColor, QPen, QFont
+from PyQt5.QtGui import QImage, QImageReader, QTransform, QPixmapCache
 from PyQt5.QtCore import QRect, QPoint
 
+# EXIF tag id of 'Orientation' (ExifTags.TAGS maps it back to that name)
+ORIENTATION_TAG = 0x0112
+# Clockwise rotation (degrees) that displays an image with the given EXIF orientation upright
+EXIF_ROTATION = {3: 180, 6: 90, 8: 270}
+
+
+def resizeImage(image_fn, width, height):
+    """
+    Load an image file downscaled to the given size.
+    OpenCV's SIMD-accelerated INTER_AREA resize is used when OpenCV can decode the file;
+    otherwise Qt's smooth transformation is used as a fallback.
+
+    Args:
+        image_fn (str): Path to the image file.
+        width (int): Target width in pixels.
+        height (int): Target height in pixels.
+
+    Returns:
+        QImage: The resized image.
+    """
+    import cv2
+
+    # Decode through NumPy so non-ASCII paths work; EXIF orientation is ignored to match Qt
+    img = cv2.imdecode(np.fromfile(image_fn, np.uint8),
+                       cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if img is None:
+        return QImage(image_fn).scaled(width, height, transformMode=Qt.SmoothTransformation)
+
+    img = cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    # Copy so the QImage owns its pixels once the NumPy buffer goes away
+    return QImage(img.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+
+
+def yoloRows(boxes, labels, W, H):
+    """
+    Convert bounding boxes to YOLO format rows for all boxes at once.
+
+    Args:
+        boxes (np.ndarray): Nx4 array of bounding boxes, each in the form [lx, ly, rx, ry].
+        labels (np.ndarray): N label indices, one per box.
+        W (int): Width of the displayed image the boxes were drawn on.
+        H (int): Height of the displayed image the boxes were drawn on.
+
+    Returns:
+        np.ndarray: Nx5 array of (class, center_x / w, center_y / h, width / w, height / h).
+    """
+    boxes = np.asarray(boxes, dtype=np.float64)
+    cx = (boxes[:, 0] + boxes[:, 2]) * 0.5 / W      # center x ratio
+    cy = (boxes[:, 1] + boxes[:, 3]) * 0.5 / H      # center y ratio
+    w = (boxes[:, 2] - boxes[:, 0]) / W             # width ratio
+    h = (boxes[:, 3] - boxes[:, 1]) / H             # height ratio
+    return np.column_stack([labels, cx, cy, w, h])
+
+
+def cropRects(yolo_rows, ow, oh):
+    """
+    Project YOLO format rows back to pixel rectangles on the original image.
+
+    Args:
+        yolo_rows (np.ndarray): Nx5 array as returned by yoloRows.
+        ow (int): Width of the original image.
+        oh (int): Height of the original image.
+
+    Returns:
+        np.ndarray: Nx4 int array of (x, y, w, h) crop rectangles.
+    """
+    # np.rint rounds half to even, the same as the built-in round()
+    w = np.rint(yolo_rows[:, 3] * ow)
+    h = np.rint(yolo_rows[:, 4] * oh)
+    x = np.rint(yolo_rows[:, 1] * ow - w / 2)
+    y = np.rint(yolo_rows[:, 2] * oh - h / 2)
+    return np.column_stack([x, y, w, h]).astype(int)
+
+
+def exifRotation(image_fn):
+    """
+    Look up how far an image has to be rotated to be displayed upright.
+    Some cameras store the sensor orientation in EXIF instead of rotating the pixels.
+
+    Args:
+        image_fn (str): Path to the image file.
+
+    Returns:
+        int: Clockwise rotation in degrees (0, 90, 180 or 270).
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_fn) as im:
+            return EXIF_ROTATION.get(im.getexif().get(ORIENTATION_TAG, 1), 0)
+    except Exception:
+        # Unreadable files, and errors like DecompressionBombError that do not derive
+        # from OSError, only cost the rotation; Qt can still load the image itself
+        return 0
+
+
+def loadImage(image_fn, rotation, max_height):
+    """
+    Decode an image file, scaled down if it exceeds max_height and rotated for display.
+    Only QImage is used, so this is safe to call from a worker thread.
+
+    Args:
+        image_fn (str): Path to the image file.
+        rotation (int): Clockwise rotation in degrees applied to the image.
+        max_height (float): Largest height the displayed image may have.
+
+    Returns:
+        QImage: The image as it should be displayed.
+    """
+    # Only read the header here, so large images are decoded a single time below
+    size = QImageReader(image_fn).size()
+    if rotation in (90, 270):
+        size.transpose()
+    W, H = size.width(), size.height()
+
+    # Scale down if image is too tall for the screen
+    if H > max_height:
+        resize_ratio = max_height / H
+        W = round(W * resize_ratio)
+        H = round(H * resize_ratio)
+        if rotation in (90, 270):
+            image = resizeImage(image_fn, H, W)
+        else:
+            image = resizeImage(image_fn, W, H)
+    else:
+        image = QImage(image_fn)
+
+    if rotation:
+        image = image.transformed(QTransform().rotate(rotation))
+    return image
+
+
+class PrefetchRunnable(QRunnable):
+    """
+    Worker that decodes an upcoming image in the background, so it is already
+    in memory by the time the user moves on to it.
+    """
+    def __init__(self, image_fn, max_height, store):
+        """
+        Initialize the PrefetchRunnable.
+
+        Args:
+            image_fn (str): Path to the image file to decode.
+            max_height (float): Largest height the displayed image may have.
+            store (dict): Dictionary receiving the decoded QImage, keyed by absolute path.
+        """
+        super(PrefetchRunnable, self).__init__()
+        self.image_fn = image_fn
+        self.max_height = max_height
+        self.store = store
+
+    def run(self):
+        """Decode the image and publish it in the store."""
+        image = loadImage(self.image_fn, exifRotation(self.image_fn), self.max_height)
+        self.store[os.path.abspath(self.image_fn)] = image
+
+
+class CropSaver(QRunnable):
+    """
+    Worker that encodes and saves a cropped region in the background,
+    so the GUI can move on to the next image immediately.
+    """
+    def __init__(self, img_bgr, out_path):
+        """
+        Initialize the CropSaver.
+
+        Args:
+            img_bgr (np.ndarray): Cropped image in OpenCV BGR order; must not be a view of a shared buffer.
+            out_path (str): Destination path of the saved image.
+        """
+        super(CropSaver, self).__init__()
+        self.img_bgr = img_bgr
+        self.out_path = out_path
+
+    def run(self):
+        """Encode the crop and write it to disk."""
+        import cv2
+
+        # Encode with OpenCV straight from BGR; tofile supports non-ASCII paths (e.g., Korean)
+        buf = cv2.imencode('.jpg', self.img_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), 95])[1]
+        buf.tofile(self.out_path)
+
+
 class MyApp(QMainWindow):
     """
     Main application window that hosts the MainWidget and a status bar.
@@ -89,11 +273,16 @@ class ImageWidget(QWidget):
         """
         super(ImageWidget, self).__init__(parent)
         self.parent = parent          # Reference to parent window
-        self.results = []             # Stores bounding boxes and label indices
+        # Bounding boxes stored as parallel arrays: (lx, ly, rx, ry) corners, label indices
+        # (-1 while a box is unlabeled) and the number of boxes in use; capacity doubles as needed
+        self._xyxy = np.empty((64, 4), np.int32)
+        self._label = np.full(64, -1, np.int16)
+        self._n = 0
         self.setMouseTracking(True)   # Enable tracking for the mouse position
         self.key_config = key_cfg     # List of label strings
         self.screen_height = QDesktopWidget().screenGeometry().height()
         self.last_idx = 0             # Stores the last label index
+        self._prefetch = {}           # Images decoded ahead of time, keyed by absolute path
 
         self.initUI()
         
@@ -109,9 +298,23 @@ class ImageWidget(QWidget):
 
         # Keep a copy of the current pixmap for drawing operations
         self.pixmapOriginal = QPixmap.copy(self.pixmap)
+        # Same image in Qt's preferred raster format, used as the drawing canvas
+        self._originalImage = self.pixmapOriginal.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        # Back buffer that drawResultBox renders into, reallocated only when the size changes
+        self._back = QImage()
+        # Unscaled image that pixmapOriginal is resampled from when the widget is resized
+        self.pixmapSource = self.pixmap
 
         self.drawing = False
         self.lastPoint = QPoint()
+        self._draw_base = None    # Pixmap with all result boxes baked in, reused while drawing
+        self._lastDirty = QRect() # Rubber-band rectangle drawn by the previous mouse move
+        self._lastCursor = (-1, -1)  # Cursor position last shown in the status bar
+
+        # Pens and font for drawing boxes and their labels, built once and shared by all paints
+        self.boxPen = QPen(Qt.red, 2, Qt.SolidLine)
+        self.labelPen = QPen(Qt.blue, 2, Qt.SolidLine)
+        self.labelFont = QFont('mono', 15, 1)
 
         # Layout to hold the image label
         hbox = QHBoxLayout(self.label_img)
@@ -121,9 +324,27 @@ class ImageWidget(QWidget):
         """
         Paint event callback to draw the QPixmap onto the widget surface.
         This is automatically called whenever the widget needs to be redrawn.
+        Only the damaged region reported by the event is blitted; the pixmap always
+        matches the widget size (see resizeEvent), so no scaling is involved.
         """
         painter = QPainter(self)
-        painter.drawPixmap(self.rect(), self.pixmap)
+        dirty = event.rect()
+        painter.setClipRect(dirty)
+        painter.drawPixmap(dirty, self.pixmap, dirty)
+
+    def resizeEvent(self, event):
+        """
+        Resize event callback. Loaded images pin the widget to their own size, but the
+        placeholder image follows the layout, so it is scaled here once per resize
+        instead of being stretched on every paintEvent.
+        """
+        if self.pixmap.size() != event.size():
+            self.pixmapOriginal = QPixmap.scaled(self.pixmapSource,
+                                                 event.size(),
+                                                 transformMode=Qt.SmoothTransformation)
+            self._originalImage = self.pixmapOriginal.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            self._draw_base = None
+            self.pixmap = self.drawResultBox()
 
     def mousePressEvent(self, event):
         """
@@ -132,20 +353,26 @@ class ImageWidget(QWidget):
           - If right-click, attempt to remove a bounding box if clicked inside one.
         """
         if event.button() == Qt.LeftButton:
-            # Store a copy of current pixmap before starting a new drawing
-            self.prev_pixmap = self.pixmap
+            # Render the existing boxes once so mouse moves only add the rubber band.
+            # self.pixmap becomes the canvas the rubber band is drawn on in place;
+            # it detaches from the base on the first paint, once per drag.
+            self._draw_base = self.drawResultBox()
+            self.pixmap = QPixmap(self._draw_base)
+            self._lastDirty = QRect()
             self.drawing = True
             self.lastPoint = event.pos()
         elif event.button() == Qt.RightButton:
             x, y = event.pos().x(), event.pos().y()
-            # Check each bounding box to see if the click is inside one; if so, remove that box
-            for i, box in enumerate(self.results):
-                lx, ly, rx, ry = box[:4]
-                if lx <= x <= rx and ly <= y <= ry:
-                    self.results.pop(i)
-                    self.pixmap = self.drawResultBox()
-                    self.update()
-                    break
+            # Test all bounding boxes at once; if the click is inside one, remove the first hit.
+            # The point is inside when none of the four edge distances is negative, i.e. when
+            # the sign bit of their bitwise OR is clear.
+            boxes = self._xyxy[:self._n]
+            mask = ((x - boxes[:, 0]) | (boxes[:, 2] - x) | (y - boxes[:, 1]) | (boxes[:, 3] - y)) >= 0
+            if mask.any():
+                self.removeBox(int(np.argmax(mask)))
+                self._draw_base = None
+                self.pixmap = self.drawResultBox()
+                self.update()
             
     def mouseMoveEvent(self, event):
         """
@@ -153,21 +380,39 @@ class ImageWidget(QWidget):
           - Updates the cursor position label in the status bar.
           - If left button is pressed and drawing is active, draws a rectangle in real-time.
         """
-        # Update the cursor position in the status bar
-        self.parent.cursorPos.setText('({}, {})'.format(event.pos().x(), event.pos().y()))
+        # Update the cursor position in the status bar, skipping sub-2px moves
+        # so the label is not re-laid out on every mouse event
+        x, y = event.pos().x(), event.pos().y()
+        dx, dy = x - self._lastCursor[0], y - self._lastCursor[1]
+        if abs(dx) + abs(dy) >= 2:
+            self.parent.cursorPos.setText('({}, {})'.format(x, y))
+            self._lastCursor = (x, y)
 
         # If left button is pressed, update the rectangle on the image
-        if event.buttons() and Qt.LeftButton and self.drawing:
-            self.pixmap = QPixmap.copy(self.prev_pixmap)
-            painter = QPainter(self.pixmap)
-            painter.setPen(QPen(Qt.red, 2, Qt.SolidLine))
+        if (event.buttons() & Qt.LeftButton) and self.drawing:
+            if self._draw_base is None:
+                self._draw_base = self.drawResultBox()
+                self.pixmap = QPixmap(self._draw_base)
             p1_x, p1_y = self.lastPoint.x(), self.lastPoint.y()
             p2_x, p2_y = event.pos().x(), event.pos().y()
-            painter.drawRect(min(p1_x, p2_x), 
-                             min(p1_y, p2_y), 
-                             abs(p1_x - p2_x), 
-                             abs(p1_y - p2_y))
-            self.update()
+            rubber = QRect(min(p1_x, p2_x), 
+                           min(p1_y, p2_y), 
+                           abs(p1_x - p2_x), 
+                           abs(p1_y - p2_y))
+            # Only the area covered by the old and new rubber bands (plus the pen width) changes
+            dirty = self._lastDirty.united(rubber).adjusted(-2, -2, 2, 2)
+
+            painter = QPainter(self.pixmap)
+            # Erase the previous rubber band by restoring that area from the cached boxes
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawPixmap(dirty, self._draw_base, dirty)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            painter.setPen(self.boxPen)
+            painter.drawRect(rubber)
+            painter.end()
+
+            self.update(dirty)
+            self._lastDirty = rubber
 
     def mouseReleaseEvent(self, event):
         """
@@ -177,6 +422,7 @@ class ImageWidget(QWidget):
           - If manual label, waits for user to label the box before proceeding.
         """
         if event.button() == Qt.LeftButton:
+            self._draw_base = None
             p1_x, p1_y = self.lastPoint.x(), self.lastPoint.y() 
             p2_x, p2_y = event.pos().x(), event.pos().y()
             lx, ly = min(p1_x, p2_x), min(p1_y, p2_y)
@@ -185,23 +431,22 @@ class ImageWidget(QWidget):
             # Only process if the box is not a zero-area line
             if (p1_x, p1_y) != (p2_x, p2_y):
                 # Check if the last box is labeled or not
-                if self.results and (len(self.results[-1]) == 4) and self.parent.autoLabel.text() == 'Manual Label':
+                if self._n and self._label[self._n - 1] == -1 and self.parent.autoLabel.text() == 'Manual Label':
                     # If the last box is incomplete in manual mode, prompt the user
                     self.showPopupOk('warning messege', 'Please mark the box you drew.')
                     self.pixmap = self.drawResultBox()
                     self.update()
                 elif self.parent.autoLabel.text() == 'Auto Label':
                     # If in auto-label mode, append the current label index automatically
-                    self.results.append([lx, ly, lx + w, ly + h, self.last_idx])
+                    self.appendBox(lx, ly, lx + w, ly + h, self.last_idx)
                     # Fill empty labels for previously drawn but unlabeled boxes
-                    for i, result in enumerate(self.results):
-                        if len(result) == 4:
-                            self.results[i].append(self.last_idx)
+                    labels = self._label[:self._n]
+                    labels[labels == -1] = self.last_idx
                     self.pixmap = self.drawResultBox()
                     self.update()
                 else:
                     # Manual label mode: store just the box, label to be assigned later
-                    self.results.append([lx, ly, lx + w, ly + h])
+                    self.appendBox(lx, ly, lx + w, ly + h)
                 self.drawing = False
 
     def showPopupOk(self, title: str, content: str):
@@ -222,61 +467,89 @@ class ImageWidget(QWidget):
 
     def drawResultBox(self):
         """
-        Redraw the bounding boxes onto a fresh copy of the original pixmap.
+        Redraw the bounding boxes over the original image.
+        Drawing happens on a persistent premultiplied ARGB32 back buffer, which the
+        raster engine paints into without format conversions.
 
         Returns:
             QPixmap: The updated pixmap with all bounding boxes.
         """
-        res = QPixmap.copy(self.pixmapOriginal)
-        painter = QPainter(res)
-
-        # Use a font for labeling the bounding box text
-        font = QFont('mono', 15, 1)
-        painter.setFont(font)
-        painter.setPen(QPen(Qt.red, 2, Qt.SolidLine))
-
-        # Draw each bounding box; if it has a label (5 items), draw that as text in blue
-        for box in self.results:
-            lx, ly, rx, ry = box[:4]
+        # Reuse the back buffer instead of allocating a new image for every edit
+        if self._back.size() != self._originalImage.size():
+            self._back = QImage(self._originalImage.size(), QImage.Format_ARGB32_Premultiplied)
+        painter = QPainter(self._back)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.drawImage(0, 0, self._originalImage)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+        # Draw all bounding boxes in red first, then all labels in blue,
+        # so the painter state only changes once instead of twice per box
+        boxes = self._xyxy[:self._n].tolist()
+        painter.setPen(self.boxPen)
+        for lx, ly, rx, ry in boxes:
             painter.drawRect(lx, ly, rx - lx, ry - ly)
-            if len(box) == 5:
-                painter.setPen(QPen(Qt.blue, 2, Qt.SolidLine))
-                painter.drawText(lx, ly + 15, self.key_config[box[-1]])
-                painter.setPen(QPen(Qt.red, 2, Qt.SolidLine))
-        return res
 
-    def setPixmap(self, image_fn):
+        # Boxes that have a label get it drawn as text
+        painter.setPen(self.labelPen)
+        painter.setFont(self.labelFont)
+        for (lx, ly, _, _), idx in zip(boxes, self._label[:self._n].tolist()):
+            if idx >= 0:
+                painter.drawText(lx, ly + 15, self.key_config[idx])
+        painter.end()
+        return QPixmap.fromImage(self._back)
+
+    def setPixmap(self, image_fn, rotation=0):
         """
         Load a new image into the widget from a file, resize it if it exceeds screen height.
 
         Args:
             image_fn (str): Path to the image file.
-        """
-        self.pixmap = QPixmap(image_fn)
+            rotation (int): Clockwise rotation in degrees applied to the displayed image.
+        """
+        # Images seen before are served from Qt's pixmap cache, skipping decode and scaling;
+        # otherwise use the prefetched image if the worker has already finished decoding it
+        key = os.path.abspath(image_fn)
+        self.pixmap = QPixmapCache.find(key)
+        if self.pixmap is None:
+            image = self._prefetch.pop(key, None)
+            if image is None:
+                image = loadImage(image_fn, rotation, self.screen_height * 0.8)
+            self.pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, self.pixmap)
         self.W, self.H = self.pixmap.width(), self.pixmap.height()
-
-        # Scale down if image is too tall for the screen
-        if self.H > self.screen_height * 0.8:
-            resize_ratio = (self.screen_height * 0.8) / self.H
-            self.W = round(self.W * resize_ratio)
-            self.H = round(self.H * resize_ratio)
-            self.pixmap = QPixmap.scaled(self.pixmap, 
-                                         self.W, 
-                                         self.H,
-                                         transformMode=Qt.SmoothTransformation)
         
+        self.pixmapOriginal = QPixmap.copy(self.pixmap)
+        self._originalImage = self.pixmapOriginal.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        self.pixmapSource = self.pixmap
+        self._draw_base = None
+
         # Update status bar and fix widget size
         self.parent.imageSize.setText('{}x{}'.format(self.W, self.H))
         self.setFixedSize(self.W, self.H)
-        self.pixmapOriginal = QPixmap.copy(self.pixmap)
+
+    def prefetch(self, image_fn):
+        """
+        Start decoding an image on the global thread pool so a later setPixmap can skip it.
+
+        Args:
+            image_fn (str): Path to the image file.
+        """
+        if QPixmapCache.find(os.path.abspath(image_fn)) is not None:
+            return
+        # Drop images that were decoded but never shown
+        self._prefetch.clear()
+        QThreadPool.globalInstance().start(
+            PrefetchRunnable(image_fn, self.screen_height * 0.8, self._prefetch)
+        )
 
     def cancelLast(self):
         """
-        Remove the most recently added bounding box from the results list, if any.
+        Remove the most recently added bounding box, if any.
         Useful for the user to undo the last drawing.
         """
-        if self.results:
-            self.results.pop()
+        if self._n:
+            self._n -= 1
+            self._draw_base = None
             self.pixmap = self.drawResultBox()
             self.update()
     
@@ -289,20 +562,60 @@ class ImageWidget(QWidget):
         """
         return self.W, self.H
 
+    def getBoxes(self):
+        """
+        Provide the bounding boxes for the current image as arrays.
+
+        Returns:
+            tuple: (Nx4 int array of [lx, ly, rx, ry], N int array of label indices with -1 for unlabeled boxes).
+                   Both are views into the widget's buffers and change with further edits.
+        """
+        return self._xyxy[:self._n], self._label[:self._n]
+
     def getResult(self):
         """
         Provide the list of all bounding boxes for the current image.
+        Kept for callers that expect the nested-list layout; getBoxes avoids the conversion.
 
         Returns:
             list: A list of bounding box definitions, each either [lx, ly, rx, ry] or [lx, ly, rx, ry, idx].
         """
-        return self.results
+        return [box + [idx] if idx >= 0 else box
+                for box, idx in zip(self._xyxy[:self._n].tolist(), self._label[:self._n].tolist())]
 
     def resetResult(self):
         """
-        Clear any drawn bounding boxes and reset the results list for a fresh image.
+        Clear any drawn bounding boxes for a fresh image.
         """
-        self.results = []
+        self._n = 0
+        self._draw_base = None
+
+    def appendBox(self, lx, ly, rx, ry, idx=-1):
+        """
+        Add a bounding box, growing the buffers by doubling when they are full.
+
+        Args:
+            lx, ly, rx, ry (int): Corners of the box.
+            idx (int): Label index of the box, or -1 if it is not labeled yet.
+        """
+        if self._n == len(self._xyxy):
+            self._xyxy = np.concatenate([self._xyxy, np.empty_like(self._xyxy)])
+            self._label = np.concatenate([self._label, np.full_like(self._label, -1)])
+        self._xyxy[self._n] = lx, ly, rx, ry
+        self._label[self._n] = idx
+        self._n += 1
+
+    def removeBox(self, i):
+        """
+        Remove the bounding box at position i, keeping the order of the others.
+
+        Args:
+            i (int): Position of the box to remove.
+        """
+        n = self._n
+        self._xyxy[i:n - 1] = self._xyxy[i + 1:n]
+        self._label[i:n - 1] = self._label[i + 1:n]
+        self._n -= 1
 
     def markBox(self, idx):
         """
@@ -312,15 +625,10 @@ class ImageWidget(QWidget):
             idx (int): Label index to assign (the position within key_config).
         """
         self.last_idx = idx
-        if self.results:
-            if len(self.results[-1]) == 4:
-                # If the last box is missing a label, append this new label
-                self.results[-1].append(idx)
-            elif len(self.results[-1]) == 5:
-                # If the last box already had a label, replace it
-                self.results[-1][-1] = idx
-            else:
-                raise ValueError('invalid results')
+        if self._n:
+            # Set the label of the last box, replacing it if the box already had one
+            self._label[self._n - 1] = idx
+            self._draw_base = None
             self.pixmap = self.drawResultBox()
             self.update()
 
@@ -435,12 +743,12 @@ class MainWidget(QWidget):
 
         if not img:
             # Write bounding box results for the current image
-            res = self.label_img.getResult()
+            boxes, labels = self.label_img.getBoxes()
             # If the last box is incomplete (missing label), show a warning
-            if res and len(res[-1]) != 5:
+            if len(labels) and labels[-1] == -1:
                 self.label_img.showPopupOk('warning messege', 'please mark the box you drew.')
                 return 'Not Marked'
-            self.writeResults(res)
+            self.writeResults(boxes, labels)
             self.label_img.resetResult()
 
             # Attempt to load the next image from the list; if none remain, display an "end" placeholder
@@ -452,82 +760,64 @@ class MainWidget(QWidget):
             # If a specific image is passed, skip results saving and just load
             self.label_img.resetResult()
 
-        # Correct orientation if needed (some cameras store orientation in EXIF)
-        try:
-            im = Image.open(self.currentImg)
-            for orientation in ExifTags.TAGS.keys():
-                if ExifTags.TAGS[orientation] == 'Orientation':
-                    break 
-            exif = dict(im.getexif().items())
-            # If EXIF orientation is 3, 6, or 8, rotate the image
-            if exif[orientation] in [3, 6, 8]:
-                im = im.transpose(Image.ROTATE_180)
-                im.save(self.currentImg)
-        except:
-            pass
+        # Correct orientation if needed (some cameras store orientation in EXIF).
+        # Only the displayed copy is rotated; the source file is never rewritten.
+        rotation = exifRotation(self.currentImg)
 
         # Update the UI to show the newly loaded image
         basename = os.path.basename(self.currentImg)
         self.parent.fileName.setText(basename)
         self.parent.progress.setText(str(self.total_imgs - len(self.imgList)) + '/' + str(self.total_imgs))
 
-        self.label_img.setPixmap(self.currentImg)
+        self.label_img.setPixmap(self.currentImg, rotation)
         self.label_img.update()
         self.parent.fitSize()
 
-    def writeResults(self, res: list):
+        # Decode the next image in the background while the user annotates this one
+        if self.imgList:
+            self.label_img.prefetch(self.imgList[0])
+
+    def writeResults(self, boxes, labels):
         """
         Save bounding box annotations to a .txt file in YOLO format and optionally crop regions.
 
         Args:
-            res (list): A list of bounding boxes, each in the form [lx, ly, rx, ry, idx].
+            boxes (np.ndarray): Nx4 array of bounding boxes, each in the form [lx, ly, rx, ry].
+            labels (np.ndarray): N label indices, one per box.
         """
         # Skip if no image is loaded yet
         if self.parent.fileName.text() != 'Ready':
             W, H = self.label_img.getRatio()
 
-            # If there are no bounding boxes, create an empty file for YOLO
-            if not res:
-                open(self.currentImg[:-4]+'.txt', 'a', encoding='utf8').close()
-
-            # Process each bounding box and write YOLO format lines
-            for i, elements in enumerate(res):
-                lx, ly, rx, ry, idx = elements
-                # YOLO format: (class, center_x / w, center_y / h, width / w, height / h)
-                yolo_format = [
-                    idx,
-                    (lx + rx) / 2 / W,      # center x ratio
-                    (ly + ry) / 2 / H,      # center y ratio
-                    (rx - lx) / W,          # width ratio
-                    (ry - ly) / H           # height ratio
-                ]
-                with open(self.currentImg[:-4]+'.txt', 'a', encoding='utf8') as resultFile:
-                    resultFile.write(' '.join([str(x) for x in yolo_format])+'\n')
-
-                # Crop mode: create separate images for each bounding box
-                if self.crop_mode:
-                    img = cv2.imread(self.currentImg)
-                    # If the image path has non-ASCII characters (e.g., Korean), load with NumPy + cv2.imdecode
-                    if img is None:
-                        n = np.fromfile(self.currentImg, np.uint8)
-                        img = cv2.imdecode(n, cv2.IMREAD_COLOR)
-                    oh, ow = img.shape[:2]
-
-                    # Convert ratio-based coords back to absolute pixel coords
-                    w, h = round(yolo_format[3] * ow), round(yolo_format[4] * oh)
-                    x = round(yolo_format[1] * ow - w / 2)
-                    y = round(yolo_format[2] * oh - h / 2)
-
-                    # Crop and save the ROI
-                    crop_img = img[y : y + h, x : x + w]
-                    basename = os.path.basename(self.currentImg)
+            yolo_rows = yoloRows(boxes, labels, W, H)
+
+            # Format and write all lines in one go; an empty file is still created when there are no boxes
+            np.savetxt(self.currentImg[:-4]+'.txt', yolo_rows,
+                       fmt=['%d', '%.6f', '%.6f', '%.6f', '%.6f'], encoding='utf8')
+
+            # Crop mode: create separate images for each bounding box
+            if self.crop_mode and len(yolo_rows):
+                import cv2
+
+                # Decode the source image once for all of its bounding boxes
+                img = cv2.imread(self.currentImg)
+                # If the image path has non-ASCII characters (e.g., Korean), load with NumPy + cv2.imdecode
+                if img is None:
+                    n = np.fromfile(self.currentImg, np.uint8)
+                    img = cv2.imdecode(n, cv2.IMREAD_COLOR)
+                oh, ow = img.shape[:2]
+
+                basename = os.path.basename(self.currentImg)
+                rects = cropRects(yolo_rows, ow, oh)
+                for i, (idx, (x, y, w, h)) in enumerate(zip(yolo_rows[:, 0].astype(int), rects.tolist())):
+                    # Crop the ROI; copy it so the worker does not keep a view into the full image
+                    crop_img = img[y : y + h, x : x + w].copy()
                     filename = basename[:-4] + '-{}-{}.jpg'.format(self.key_config[idx], i)
 
-                    # Convert from OpenCV BGR to RGB for PIL saving
-                    crop_img = cv2.cvtColor(crop_img, cv2.COLOR_BGR2RGB)
-                    crop_img = Image.fromarray(crop_img)
-                    # Save the cropped image in the designated directory
-                    crop_img.save(os.path.join(self.save_directory, filename), dpi=(300,300))
+                    # Save the cropped image in the designated directory off the GUI thread
+                    QThreadPool.globalInstance().start(
+                        CropSaver(crop_img, os.path.join(self.save_directory, filename))
+                    )
 
     def registerSavePath(self, savePathButton, label):
         """
@@ -566,20 +856,16 @@ class MainWidget(QWidget):
             print("Input Path not selected")
             return -1
         
-        # Get all .jpg and .png files from the selected directory
-        types = ('*.jpg', '*.png')
-        self.imgList = []
-        for t in types:
-            self.imgList.extend(glob(directory + '/' + t))
-        self.total_imgs = len(self.imgList)
+        # List the directory once and get all .jpg and .png files from it;
+        # hidden files (e.g. macOS '._' AppleDouble files) are skipped like glob did
+        with os.scandir(directory) as it:
+            entries = [e.name for e in it if e.is_file() and not e.name.startswith('.')]
+        names = set(entries)
+        images = [n for n in entries if n.lower().endswith(('.jpg', '.png'))]
+        self.total_imgs = len(images)
 
         # Skip images that already have .txt files (already labeled)
-        to_skip = []
-        for imgPath in self.imgList:
-            if os.path.exists(imgPath[:-4] + '.txt'):
-                to_skip.append(imgPath)
-        for skip in to_skip:
-            self.imgList.remove(skip)
+        self.imgList = [os.path.join(directory, n) for n in images if n[:-4] + '.txt' not in names]
 
         inputPathLabel.setText(basename + '/')
         okButton.setEnabled(True)
@@ -663,5 +949,10 @@ if __name__ == '__main__':
     Initializes the QApplication, constructs and displays the main window.
     """
     app = QApplication(sys.argv)
+    # Room for the scaled pixmaps of recently viewed images (limit is in KB)
+    QPixmapCache.setCacheLimit(200 * 1024)
     ex = MyApp()
-    sys.exit(app.exec_())
+    ret = app.exec_()
+    # Let background workers finish before the interpreter shuts down
+    QThreadPool.globalInstance().waitForDone()
+    sys.exit(ret)